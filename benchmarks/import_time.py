@@ -0,0 +1,124 @@
+''' Measure cold-start time of the serializer registry.
+
+Each scenario runs in a fresh interpreter so nothing is cached in
+``sys.modules``. Only the scenario code is timed; its setup (e.g. importing
+streamlit, which dwarfs everything else) runs first and is excluded, so the
+difference between scenarios is not lost in noise. Run from the repository
+root:
+
+    python benchmarks/import_time.py [--runs N]
+'''
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MESSAGES = "[{'role': 'AI', 'content': 'hello'}]"
+
+CHATLOG = repr('您：hello\nAI：hi\n')
+
+TXT_SERIALIZE = f'serializer.TxtSerializer().serialize_messages({MESSAGES})'
+
+# What main.py did before the registry: eager ebooklib through
+# serializer.py, then parse and export TXT.
+APP_EAGER = (
+    'from ebooklib import epub\n'
+    'import serializer, unifier\n'
+    f'msgs = unifier.TextUnifier().unify_messages_from_content({CHATLOG})\n'
+    'serializer.TxtSerializer().serialize_messages(msgs)'
+)
+
+# What main.py does now, including both entry point scans (the plugin
+# unifier scan only happens when the built-in unifier finds nothing).
+APP_REGISTRY = (
+    'import registry\n'
+    f"msgs = registry.get_unifier('text').unify_messages_from_content({CHATLOG})\n"
+    'registry.unifiers.names()\n'
+    'registry.serializers.names()\n'
+    "registry.get_serializer('txt').serialize_messages(msgs)"
+)
+
+# name -> (untimed setup, timed code)
+SCENARIOS = {
+    # Before the registry, serializer.py imported ebooklib.epub at module
+    # level, so every TXT export paid for ebooklib and lxml.
+    'txt (eager ebooklib)': ('', (
+        'from ebooklib import epub\n'
+        'import serializer\n'
+        f'{TXT_SERIALIZE}'
+    )),
+    'txt (lazy)': ('', f'import serializer\n{TXT_SERIALIZE}'),
+    'txt via registry': ('', (
+        'import registry\n'
+        f"registry.get_serializer('txt').serialize_messages({MESSAGES})"
+    )),
+    'md via registry': ('', (
+        'import registry\n'
+        f"registry.get_serializer('md').serialize_messages({MESSAGES})"
+    )),
+    'epub via registry': ('', (
+        'import registry\n'
+        f"registry.get_serializer('epub').serialize_messages({MESSAGES})"
+    )),
+    'app txt (eager ebooklib)': ('import streamlit', APP_EAGER),
+    'app txt (registry)': ('import streamlit', APP_REGISTRY),
+}
+
+# (baseline, candidate) pairs measured under the same conditions
+COMPARISONS = [
+    ('txt (eager ebooklib)', 'txt (lazy)'),
+    ('txt (eager ebooklib)', 'txt via registry'),
+    ('app txt (eager ebooklib)', 'app txt (registry)'),
+]
+
+RUNNER = '''{setup}
+import time
+_start = time.perf_counter()
+{code}
+print(time.perf_counter() - _start)
+'''
+
+
+def time_scenario(setup: str, code: str, runs: int) -> list[float]:
+    script = RUNNER.format(setup=setup, code=code)
+    timings = []
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, '-c', script], cwd=REPO_ROOT,
+                                capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip())
+        timings.append(float(result.stdout.splitlines()[-1]))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    medians: dict[str, float] = {}
+    for name, (setup, code) in SCENARIOS.items():
+        try:
+            timings = time_scenario(setup, code, args.runs)
+        except RuntimeError as e:
+            print(f'{name:<28} failed:\n{e}')
+            continue
+        medians[name] = statistics.median(timings)
+        print(f'{name:<28} median {medians[name] * 1000:7.1f} ms'
+              f'  min {min(timings) * 1000:7.1f} ms')
+
+    print()
+    for baseline, name in COMPARISONS:
+        if baseline not in medians or name not in medians:
+            print(f'{name:<28} no comparison: {baseline!r} or {name!r} failed')
+            continue
+        saved = medians[baseline] - medians[name]
+        print(f'{name:<28} {saved * 1000:+7.1f} ms faster than '
+              f'{baseline!r} ({medians[baseline] / medians[name]:.2f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,8 @@
 import time
+from typing import Iterator
 
-import unifier
 import filter
-import serializer
+import registry
 
 from message import Message
 
@@ -28,15 +28,28 @@ def auto_decode(content: bytes) -> str:
     return content.decode('latin-1', errors='replace')
 
 
-def try_unifiers(role_prefixes: list[str], content: str) -> list[Message]:
-    unifiers: list[unifier.MessageUnifier] = [
-        unifier.TextUnifier(role_prefixes=role_prefixes),
-    ]
+def unifier_names() -> Iterator[str]:
+    yield from registry.BUILTIN_UNIFIERS
+
+    # Scanning entry points is slow, so plugins are only listed when no
+    # built-in unifier could read the file.
+    for name in registry.unifiers.names():
+        if name not in registry.BUILTIN_UNIFIERS:
+            yield name
+
+
+@st.cache_resource
+def plugin_export_formats() -> list[str]:
+    return [name for name in registry.serializers.names()
+            if name not in registry.BUILTIN_SERIALIZERS]
 
+
+def try_unifiers(role_prefixes: list[str], content: str) -> list[Message]:
     last_exception = None
 
-    for u in unifiers:
+    for name in unifier_names():
         try:
+            u = registry.get_unifier(name, role_prefixes=role_prefixes)
             messages = u.unify_messages_from_content(content)
             if messages:
                 return messages
@@ -94,12 +107,19 @@ def main():
     messages = try_unifiers(role_prefixes, content)
     st.text(f'成功載入對話，共 {len(messages)} 筆訊息。')
 
+    extra_formats = plugin_export_formats()
+
+    tab_labels = ['檔案預覽', '清理後預覽', '匯出格式 (txt)', '匯出格式 (md)',
+                  '匯出格式 (epub)']
+    if extra_formats:
+        tab_labels.append('匯出格式 (其他)')
+
     tab_original_file_preview, \
         tab_after_cleanup_preview, \
         tab_export_txt, \
-        tab_export_epub = st.tabs([
-            '檔案預覽', '清理後預覽', '匯出格式 (txt)', '匯出格式 (epub)'
-        ])
+        tab_export_md, \
+        tab_export_epub, \
+        *tab_export_others = st.tabs(tab_labels)
 
     def show_message_preview(msgs, k=10):
         for msg in msgs[:k]:
@@ -125,6 +145,9 @@ def main():
     for f in filters:
         msgs = f.filter_messages(msgs)
 
+    # 用來判斷先前產生的匯出檔是否仍對應目前的對話內容
+    messages_key = hash(tuple((msg['role'], msg['content']) for msg in msgs))
+
     with tab_after_cleanup_preview:
         st.text('清理後前 10 筆對話預覽')
         show_message_preview(msgs, 10)
@@ -139,7 +162,8 @@ def main():
             help='將連續換行數量限制為最多兩行，以避免過多空白')
 
         max_newlines = 2 if max_2_newlines else 0
-        file_serializer = serializer.TxtSerializer(
+        file_serializer = registry.get_serializer(
+            'txt',
             max_newlines=max_newlines,
             add_split_lines=add_split_lines)
         file_extension = 'txt'
@@ -160,6 +184,38 @@ def main():
             mime=mime_type
         )
 
+    with tab_export_md:
+        md_add_split_lines = st.checkbox(
+            '在訊息間加入分隔線', value=True,
+            key='md_add_split_lines',
+            help='在每則訊息之間加入分隔線以增加可讀性')
+
+        md_max_2_newlines = st.checkbox(
+            '限制連續換行數量至兩行', value=True,
+            key='md_max_newlines',
+            help='將連續換行數量限制為最多兩行，以避免過多空白')
+
+        max_newlines = 2 if md_max_2_newlines else 0
+        md_serializer = registry.get_serializer(
+            'md',
+            max_newlines=max_newlines,
+            add_split_lines=md_add_split_lines)
+
+        md_content = md_serializer.serialize_messages(msgs)
+
+        with st.expander('前 100 行輸出預覽'):
+            st.text('\n'.join(md_content.splitlines()[:100]))
+
+        timestamp = int(time.time())
+        md_filename = f'dialogue_{timestamp}.md'
+
+        st.download_button(
+            label='下載整理後的 md 檔案',
+            data=md_content,
+            file_name=md_filename,
+            mime='text/markdown'
+        )
+
     with tab_export_epub:
         st.markdown('### EPUB 電子書設定')
 
@@ -205,49 +261,92 @@ def main():
 
         st.markdown('---')
 
+        # 產生 EPUB 需要載入 ebooklib，只在使用者要求時才執行。
+        # 產生的檔案存在 session_state，下載造成的重新執行不會讓它消失，
+        # 設定或對話內容改變後才需要重新產生。
         max_newlines = 2 if epub_max_newlines else 0
-        epub_serializer = serializer.EpubSerializer(
+        epub_settings = dict(
             title=epub_title,
             author=epub_author,
             max_newlines=max_newlines,
             chapter_mode=chapter_mode,
             user_role_prefix=user_role_prefix
         )
-
-        try:
-            epub_content = epub_serializer.serialize_messages(msgs)
-
-            # 計算章節數量信息
-            if chapter_mode == 'batch':
-                chapter_count = (len(msgs) + 49) // 50
-                chapter_info = f'分為 {chapter_count} 章 (每章最多50條對話)'
-            elif chapter_mode == 'per_message':
-                chapter_count = len(msgs)
-                chapter_info = f'分為 {chapter_count} 章 (每條對話一章)'
-            else:  # user_start
-                # 計算用戶消息數量來估計章節數
-                user_msg_count = sum(1 for msg in msgs if
-                                     msg['role'].startswith(user_role_prefix) or
-                                     msg['role'].startswith(user_role_prefix.rstrip('：')) or
-                                     '您' in msg['role'] or 'User' in msg['role'] or '用戶' in msg['role'])
-                chapter_info = f'約 {user_msg_count} 章 (用戶消息開始新章節)'
-
+        epub_key = (messages_key, tuple(epub_settings.items()))
+
+        epub_export = st.session_state.get('epub_export')
+        if (epub_export is None or epub_export['key'] != epub_key) and \
+                st.button('產生 EPUB 電子書'):
+            try:
+                epub_serializer = registry.get_serializer(
+                    'epub', **epub_settings)
+                epub_content = epub_serializer.serialize_messages(msgs)
+
+                # 計算章節數量信息
+                if chapter_mode == 'batch':
+                    chapter_count = (len(msgs) + 49) // 50
+                    chapter_info = f'分為 {chapter_count} 章 (每章最多50條對話)'
+                elif chapter_mode == 'per_message':
+                    chapter_count = len(msgs)
+                    chapter_info = f'分為 {chapter_count} 章 (每條對話一章)'
+                else:  # user_start
+                    # 計算用戶消息數量來估計章節數
+                    user_msg_count = sum(1 for msg in msgs if
+                                         msg['role'].startswith(user_role_prefix) or
+                                         msg['role'].startswith(user_role_prefix.rstrip('：')) or
+                                         '您' in msg['role'] or 'User' in msg['role'] or '用戶' in msg['role'])
+                    chapter_info = f'約 {user_msg_count} 章 (用戶消息開始新章節)'
+
+                epub_export = {
+                    'key': epub_key,
+                    'data': epub_content,
+                    'info': chapter_info,
+                    'file_name': f'dialogue_{int(time.time())}.epub',
+                }
+                st.session_state['epub_export'] = epub_export
+
+            except Exception as e:
+                st.error(f'❌ EPUB 生成失敗：{str(e)}')
+                st.text('請檢查是否已正確安裝相關依賴套件。')
+
+        if epub_export is not None and epub_export['key'] == epub_key:
             st.success(f'✅ EPUB 電子書生成成功！')
-            st.info(f'📚 包含 {len(msgs)} 條對話，{chapter_info}')
-
-            timestamp = int(time.time())
-            epub_filename = f'dialogue_{timestamp}.epub'
+            st.info(f'📚 包含 {len(msgs)} 條對話，{epub_export["info"]}')
 
             st.download_button(
                 label='📥 下載 EPUB 電子書',
-                data=epub_content,
-                file_name=epub_filename,
+                data=epub_export['data'],
+                file_name=epub_export['file_name'],
                 mime='application/epub+zip'
             )
 
-        except Exception as e:
-            st.error(f'❌ EPUB 生成失敗：{str(e)}')
-            st.text('請檢查是否已正確安裝相關依賴套件。')
-
+    if extra_formats:
+        with tab_export_others[0]:
+            export_format = st.selectbox(
+                '選擇匯出格式', options=extra_formats,
+                help='由其他套件透過 entry point 註冊的匯出格式')
+            other_key = (messages_key, export_format)
+
+            other_export = st.session_state.get('other_export')
+            if (other_export is None or other_export['key'] != other_key) and \
+                    st.button('產生檔案'):
+                try:
+                    other_serializer = registry.get_serializer(export_format)
+                    other_export = {
+                        'key': other_key,
+                        'data': other_serializer.serialize_messages(msgs),
+                        'file_name': f'dialogue_{int(time.time())}.{export_format}',
+                    }
+                    st.session_state['other_export'] = other_export
+                except Exception as e:
+                    st.error(f'❌ {export_format} 匯出失敗：{str(e)}')
+
+            if other_export is not None and other_export['key'] == other_key:
+                st.download_button(
+                    label=f'下載整理後的 {export_format} 檔案',
+                    data=other_export['data'],
+                    file_name=other_export['file_name'],
+                    mime='application/octet-stream'
+                )
 
 main()
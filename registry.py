@@ -0,0 +1,119 @@
+import importlib
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from importlib.metadata import EntryPoint
+
+    from serializer import Serializer
+    from unifier import MessageUnifier
+
+SERIALIZER_ENTRY_POINT_GROUP = 'chatlog_tool.serializers'
+UNIFIER_ENTRY_POINT_GROUP = 'chatlog_tool.unifiers'
+
+BUILTIN_SERIALIZERS = {
+    'txt': 'serializer:TxtSerializer',
+    'md': 'serializer:MarkdownSerializer',
+    'epub': 'serializer:EpubSerializer',
+}
+
+BUILTIN_UNIFIERS = {
+    'text': 'unifier:TextUnifier',
+}
+
+T = TypeVar('T')
+
+
+class FormatLoadError(ImportError):
+    pass
+
+
+class Registry(Generic[T]):
+    ''' Maps format names to classes that are imported on first use.
+
+    Built-in formats are registered as ``'module:attr'`` strings so that
+    heavy backends (e.g. ``ebooklib`` for EPUB) are only imported when that
+    format is actually requested. Third-party formats can be added through
+    the given entry point group, which is only scanned when a name is not
+    registered here or when all names are listed.
+    '''
+
+    def __init__(self, entry_point_group: str):
+        self.entry_point_group = entry_point_group
+        self._targets: dict[str, 'str | EntryPoint | type[T]'] = {}
+        self._loaded: dict[str, type[T]] = {}
+        self._entry_points_scanned = False
+
+    def register(self, name: str, target: str | type[T]):
+        self._targets[name] = target
+        self._loaded.pop(name, None)
+
+    def names(self) -> list[str]:
+        ''' Return all format names, built-in ones first in registration
+        order, followed by those provided through entry points.
+        '''
+        self._scan_entry_points()
+        return list(self._targets)
+
+    def get(self, name: str) -> type[T]:
+        if name in self._loaded:
+            return self._loaded[name]
+
+        if name not in self._targets:
+            self._scan_entry_points()
+        if name not in self._targets:
+            raise KeyError(f'Unknown format: {name}')
+
+        target = self._targets[name]
+        try:
+            if isinstance(target, str):
+                cls = self._resolve(target)
+            elif isinstance(target, type):
+                cls = target
+            else:
+                cls = target.load()
+        except Exception as e:
+            raise FormatLoadError(
+                f'Failed to load format {name!r}: {e}') from e
+
+        self._loaded[name] = cls
+        return cls
+
+    def create(self, name: str, **kwargs: Any) -> T:
+        return self.get(name)(**kwargs)
+
+    @staticmethod
+    def _resolve(target: str) -> Any:
+        module_name, _, attrs = target.partition(':')
+        obj = importlib.import_module(module_name)
+        for attr in filter(None, attrs.split('.')):
+            obj = getattr(obj, attr)
+        return obj
+
+    def _scan_entry_points(self):
+        if self._entry_points_scanned:
+            return
+        self._entry_points_scanned = True
+
+        # Walking every installed distribution is slow, so it is only done
+        # when a name is missing from the built-in table or names are listed.
+        from importlib.metadata import entry_points
+
+        for ep in entry_points(group=self.entry_point_group):
+            self._targets.setdefault(ep.name, ep)
+
+
+serializers: 'Registry[Serializer]' = Registry(SERIALIZER_ENTRY_POINT_GROUP)
+for name, target in BUILTIN_SERIALIZERS.items():
+    serializers.register(name, target)
+
+unifiers: 'Registry[MessageUnifier]' = Registry(UNIFIER_ENTRY_POINT_GROUP)
+for name, target in BUILTIN_UNIFIERS.items():
+    unifiers.register(name, target)
+
+
+def get_serializer(name: str, **kwargs: Any) -> 'Serializer':
+    return serializers.create(name, **kwargs)
+
+
+def get_unifier(name: str, **kwargs: Any) -> 'MessageUnifier':
+    return unifiers.create(name, **kwargs)
@@ -2,11 +2,13 @@ import re
 import html
 from io import BytesIO
 from datetime import datetime
-
-from ebooklib import epub
+from typing import TYPE_CHECKING
 
 from message import Message
 
+if TYPE_CHECKING:
+    from ebooklib import epub
+
 
 class Serializer:
     def __init__(self):
@@ -22,12 +24,13 @@ class TxtSerializer(Serializer):
         self.max_newlines = max_newlines
         self.add_split_lines = add_split_lines
 
+    def format_message(self, msg: Message) -> str:
+        return f'{msg["role"]}：\n{msg["content"]}\n\n'
+
     def serialize_messages(self, messages: list[Message]) -> str:
         txt_output = ''
         for msg in messages:
-            role = msg['role']
-            content = msg['content']
-            txt_output += f'{role}：\n{content}\n\n'
+            txt_output += self.format_message(msg)
             if self.add_split_lines:
                 txt_output += '---\n\n'
 
@@ -38,6 +41,31 @@ class TxtSerializer(Serializer):
         return txt_output.strip()
 
 
+class MarkdownSerializer(TxtSerializer):
+    MARKDOWN_SPECIAL_CHARS = re.compile(r'([\\`*_{}\[\]()<>#+\-.!|~])')
+    LINE_START_MARKUP = re.compile(r'^([ \t]*)([#>+\-*=_]|\d+(?=[.)]))',
+                                   flags=re.MULTILINE)
+    SINGLE_NEWLINE = re.compile(r'(?<!\n)\n(?!\n)')
+
+    def format_message(self, msg: Message) -> str:
+        role = self.MARKDOWN_SPECIAL_CHARS.sub(r'\\\1', msg['role'])
+
+        # Keep headings, quotes and list markers at line start literal, and
+        # turn single newlines (soft breaks in Markdown) into hard breaks.
+        content = self.LINE_START_MARKUP.sub(self._escape_line_start,
+                                             msg['content'])
+        content = self.SINGLE_NEWLINE.sub('  \n', content)
+        return f'**{role}**\n\n{content}\n\n'
+
+    @staticmethod
+    def _escape_line_start(match: re.Match) -> str:
+        indent, marker = match.groups()
+        if marker.isdigit():
+            # "1." -> "1\." so the line is not read as an ordered list
+            return indent + marker + '\\'
+        return indent + '\\' + marker
+
+
 class EpubSerializer(Serializer):
     def __init__(self, title: str = "對話記錄", author: str = "Chatlog Tool", max_newlines: int = 2,
                  chapter_mode: str = "batch", user_role_prefix: str = "您："):
@@ -64,6 +92,9 @@ class EpubSerializer(Serializer):
             propagated to the caller.
         '''
 
+        # ebooklib pulls in lxml, so only import it when an EPUB is built.
+        from ebooklib import epub
+
         # Create EPUB book
         book = epub.EpubBook()
 
@@ -237,7 +268,9 @@ class EpubSerializer(Serializer):
 
         return chapters
 
-    def _create_single_chapter(self, chapter_messages: list[Message], title: str, filename: str) -> epub.EpubHtml:
+    def _create_single_chapter(self, chapter_messages: list[Message], title: str, filename: str) -> 'epub.EpubHtml':
+        from ebooklib import epub
+
         chapter_content = f'''<!DOCTYPE html>
 <html xmlns="http://www.w3.org/1999/xhtml">
 <head>
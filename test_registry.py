@@ -0,0 +1,94 @@
+import importlib.metadata
+from importlib.metadata import EntryPoint
+
+import pytest
+
+import registry
+import serializer
+
+GROUP = 'chatlog_tool.test'
+
+
+@pytest.fixture
+def fake_entry_points(monkeypatch):
+    installed: list[EntryPoint] = []
+
+    def entry_points(group: str):
+        return [ep for ep in installed if ep.group == group]
+
+    monkeypatch.setattr(importlib.metadata, 'entry_points', entry_points)
+    return installed
+
+
+def test_resolves_module_attr_string():
+    reg = registry.Registry(GROUP)
+    reg.register('txt', 'serializer:TxtSerializer')
+
+    assert reg.get('txt') is serializer.TxtSerializer
+    assert isinstance(reg.create('txt', max_newlines=0),
+                      serializer.TxtSerializer)
+
+
+def test_resolves_nested_attribute():
+    reg = registry.Registry(GROUP)
+    reg.register('pattern', 'serializer:MarkdownSerializer.SINGLE_NEWLINE')
+
+    assert reg.get('pattern') is serializer.MarkdownSerializer.SINGLE_NEWLINE
+
+
+def test_unknown_name_raises_key_error(fake_entry_points):
+    reg = registry.Registry(GROUP)
+
+    with pytest.raises(KeyError):
+        reg.get('missing')
+
+
+def test_loads_entry_points(fake_entry_points):
+    fake_entry_points.extend([
+        EntryPoint('md2', 'serializer:MarkdownSerializer', GROUP),
+        EntryPoint('module', 'message', GROUP),
+    ])
+    reg = registry.Registry(GROUP)
+    reg.register('txt', 'serializer:TxtSerializer')
+
+    assert reg.names() == ['txt', 'md2', 'module']
+    assert reg.get('md2') is serializer.MarkdownSerializer
+    assert reg.get('module') is importlib.import_module('message')
+
+
+def test_builtin_name_wins_over_entry_point(fake_entry_points):
+    fake_entry_points.append(
+        EntryPoint('txt', 'serializer:MarkdownSerializer', GROUP))
+    reg = registry.Registry(GROUP)
+    reg.register('txt', 'serializer:TxtSerializer')
+
+    assert reg.names() == ['txt']
+    assert reg.get('txt') is serializer.TxtSerializer
+
+
+def test_entry_points_not_scanned_for_builtin_names(fake_entry_points):
+    fake_entry_points.append(
+        EntryPoint('broken', 'no_such_module:Thing', GROUP))
+    reg = registry.Registry(GROUP)
+    reg.register('txt', 'serializer:TxtSerializer')
+
+    reg.get('txt')
+
+    assert not reg._entry_points_scanned
+
+
+def test_load_failure_names_format(fake_entry_points):
+    fake_entry_points.append(
+        EntryPoint('broken', 'no_such_module:Thing', GROUP))
+    reg = registry.Registry(GROUP)
+
+    with pytest.raises(registry.FormatLoadError, match="'broken'"):
+        reg.get('broken')
+
+
+def test_builtin_tables_are_registered():
+    assert registry.serializers.get('epub') is serializer.EpubSerializer
+    for name in registry.BUILTIN_SERIALIZERS:
+        assert registry.serializers.get(name)
+    for name in registry.BUILTIN_UNIFIERS:
+        assert registry.unifiers.get(name)
@@ -0,0 +1,39 @@
+import serializer
+
+
+def serialize_markdown(role: str, content: str) -> str:
+    return serializer.MarkdownSerializer().serialize_messages(
+        [{'role': role, 'content': content}])
+
+
+def test_markdown_escapes_role():
+    assert serialize_markdown('a*b_c', 'hi') == '**a\\*b\\_c**\n\nhi'
+
+
+def test_markdown_keeps_single_newlines_as_hard_breaks():
+    assert serialize_markdown('AI', 'hi\nthere\n\nnext') == \
+        '**AI**\n\nhi  \nthere\n\nnext'
+
+
+def test_markdown_escapes_line_start_markup():
+    output = serialize_markdown('AI', '# title\n> quote\n1. one\n- item')
+
+    assert output == ('**AI**\n\n\\# title  \n\\> quote  \n'
+                      '1\\. one  \n\\- item')
+
+
+def test_markdown_split_lines_and_newline_limit():
+    output = serializer.MarkdownSerializer(
+        max_newlines=2, add_split_lines=True).serialize_messages([
+            {'role': 'AI', 'content': 'a\n\n\n\nb'},
+            {'role': 'User', 'content': 'c'},
+        ])
+
+    assert output == '**AI**\n\na\n\nb\n\n---\n\n**User**\n\nc\n\n---'
+
+
+def test_txt_output_unchanged():
+    output = serializer.TxtSerializer().serialize_messages(
+        [{'role': 'AI', 'content': 'hi\nthere'}])
+
+    assert output == 'AI：\nhi\nthere'